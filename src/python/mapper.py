@@ -6,12 +6,56 @@ Date: July 2025
 Course: Big Data with Hadoop MapReduce
 
 This script implements the Mapper phase of the WordCount MapReduce job.
-It reads input text line by line from stdin, tokenizes each line into words,
-and emits key-value pairs in the format: word<TAB>1
+It reads input text from stdin in large chunks, tokenizes it into words,
+aggregates the counts locally (in-mapper combiner), and emits key-value
+pairs in the format: word<TAB>count
 """
 
 import sys
-import re
+from collections import Counter
+
+# Translation table for tokenizing raw bytes (input is never decoded):
+# ASCII digits and lowercase letters map to themselves, uppercase letters
+# map to lowercase, and every other byte maps to a space, so a plain
+# split() afterwards yields the words
+_WORD_TABLE = bytes(
+    c if (48 <= c <= 57 or 97 <= c <= 122) else (c + 32 if 65 <= c <= 90 else 32)
+    for c in range(256)
+)
+
+# Number of bytes read from stdin at a time
+_CHUNK_SIZE = 1 << 20
+
+# Flush the local counts once this many distinct words are held in memory
+_MAX_DISTINCT_WORDS = 1000000
+
+def count_words(block, counts):
+    """
+    Tokenize a block of complete input lines and add every word found
+    to the local counts
+    
+    Args:
+        block: Bytes containing one or more whole lines of input
+        counts: Counter accumulating occurrences per word
+    """
+    
+    # Lowercase and blank out punctuation in one pass, then split into
+    # words; newlines become separators too, so the whole block is
+    # tokenized at once regardless of how many lines it holds
+    counts.update(block.translate(_WORD_TABLE).split())
+
+def emit_counts(counts, out):
+    """
+    Emit the locally aggregated counts and reset them
+    
+    Args:
+        counts: Counter accumulating occurrences per word
+        out: Binary output stream
+    """
+    
+    # Output format: word<TAB>count
+    out.write(b''.join([word + b'\t%d\n' % count for word, count in counts.items()]))
+    counts.clear()
 
 def main():
     """
@@ -19,25 +63,40 @@ def main():
     and emits word counts to stdout
     """
     
-    # Process each line from standard input
-    for line in sys.stdin:
-        # Remove leading/trailing whitespace and convert to lowercase
-        line = line.strip().lower()
+    # Work on the binary streams to skip UTF-8 decoding and re-encoding
+    read = sys.stdin.buffer.read
+    out = sys.stdout.buffer
+    
+    # In-mapper combiner: aggregate counts for the whole input split and
+    # emit each word once instead of once per occurrence
+    counts = Counter()
+    
+    # Read stdin in large chunks and tokenize everything up to the last
+    # newline; the trailing partial line may end mid-word, so it is carried
+    # over to the next chunk
+    pending = b''
+    while True:
+        chunk = read(_CHUNK_SIZE)
+        if not chunk:
+            break
         
-        # Skip empty lines
-        if not line:
+        cut = chunk.rfind(b'\n') + 1
+        if cut == 0:
+            pending += chunk
             continue
-            
-        # Remove punctuation and split into words
-        # This regex keeps only alphanumeric characters and spaces
-        words = re.findall(r'[a-zA-Z0-9]+', line)
         
-        # Emit each word with count of 1
-        for word in words:
-            # Skip empty words and very short words (optional)
-            if len(word) > 0:
-                # Output format: word<TAB>1
-                print(f"{word}\t1")
+        count_words(pending + chunk[:cut], counts)
+        pending = chunk[cut:]
+        
+        # Bound memory use on splits with a very large vocabulary
+        if len(counts) > _MAX_DISTINCT_WORDS:
+            emit_counts(counts, out)
+    
+    # Process the final line if the input does not end with a newline
+    if pending:
+        count_words(pending, counts)
+    
+    emit_counts(counts, out)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
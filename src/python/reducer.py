@@ -11,7 +11,11 @@ for each word, and emits the final word count.
 """
 
 import sys
-from collections import defaultdict
+from itertools import groupby
+from operator import itemgetter
+
+# Size of the stdout buffer, so records are flushed in few large writes
+_OUTPUT_BUFFER_SIZE = 1 << 20
 
 def main():
     """
@@ -19,41 +23,22 @@ def main():
     and emits aggregated word counts
     """
     
-    current_word = None
-    current_count = 0
+    # Output goes through a large buffer of its own (stdout itself is not
+    # closed); words are passed through as raw bytes
+    out = open(sys.stdout.fileno(), 'wb', buffering=_OUTPUT_BUFFER_SIZE, closefd=False)
+    write = out.write
+    
+    # Parse each line into a (word, count) pair, skipping empty or
+    # malformed lines without a tab; int() ignores the trailing newline
+    records = (line.split(b'\t', 1) for line in sys.stdin.buffer)
+    pairs = (parts for parts in records if len(parts) == 2)
     
-    # Process each line from standard input
-    for line in sys.stdin:
-        # Remove leading/trailing whitespace
-        line = line.strip()
-        
-        # Skip empty lines
-        if not line:
-            continue
-            
-        # Parse the key-value pair (word<TAB>count)
-        try:
-            word, count = line.split('\t')
-            count = int(count)
-        except ValueError:
-            # Skip malformed lines
-            continue
-        
-        # If this is the same word as the previous one, add to count
-        if current_word == word:
-            current_count += count
-        else:
-            # If we have a previous word, emit its total count
-            if current_word is not None:
-                print(f"{current_word}\t{current_count}")
-            
-            # Start counting the new word
-            current_word = word
-            current_count = count
+    # Input is sorted by word, so all counts for a word are adjacent
+    for word, group in groupby(pairs, key=itemgetter(0)):
+        total = sum(int(count) for _, count in group)
+        write(word + b'\t%d\n' % total)
     
-    # Don't forget to emit the last word's count
-    if current_word is not None:
-        print(f"{current_word}\t{current_count}")
+    out.flush()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -9,11 +9,14 @@ This script generates sample text files for testing the WordCount MapReduce job.
 It creates realistic text data with varying word frequencies for meaningful analysis.
 """
 
+import itertools
+import multiprocessing as mp
 import os
 import random
 import string
+from functools import partial
 
-def generate_sample_text(word_count=1000, unique_words=200):
+def generate_sample_text_iter(word_count=1000, unique_words=200):
     """
     Generate sample text with specified word count and vocabulary size
     
@@ -21,8 +24,8 @@ def generate_sample_text(word_count=1000, unique_words=200):
         word_count: Total number of words to generate
         unique_words: Number of unique words in vocabulary
     
-    Returns:
-        String containing generated text
+    Yields:
+        Lines of generated text, each terminated by a newline
     """
     
     # Common English words for more realistic text
@@ -40,41 +43,63 @@ def generate_sample_text(word_count=1000, unique_words=200):
     ]
     
     # Generate additional random words to reach desired unique word count
+    # Lengths and letters are drawn in one batch each, then sliced into words
+    extra_count = max(0, unique_words - len(common_words))
+    word_lengths = random.choices(range(4, 9), k=extra_count)
+    letters = ''.join(random.choices(string.ascii_lowercase, k=sum(word_lengths)))
     additional_words = []
-    for _ in range(max(0, unique_words - len(common_words))):
-        word_length = random.randint(4, 8)
-        word = ''.join(random.choices(string.ascii_lowercase, k=word_length))
-        additional_words.append(word)
+    offset = 0
+    for word_length in word_lengths:
+        additional_words.append(letters[offset:offset + word_length])
+        offset += word_length
     
     # Combine all words
     all_words = common_words + additional_words
     
     # Create weighted distribution (some words appear more frequently)
-    word_weights = []
-    for i, word in enumerate(all_words):
-        if i < len(common_words):
-            # Common words have higher weight
-            weight = max(1, 100 - i * 2)
-        else:
-            # Additional words have lower weight
-            weight = random.randint(1, 10)
-        word_weights.append(weight)
-    
-    # Generate text
-    generated_words = random.choices(all_words, weights=word_weights, k=word_count)
-    
-    # Format into sentences and paragraphs
-    text_lines = []
+    # Common words have higher weight
+    word_weights = [max(1, 100 - i * 2) for i in range(len(common_words))]
+    # Additional words have lower weight
+    word_weights += random.choices(range(1, 11), k=extra_count)
+    
+    # Generate text, passing precomputed cumulative weights so
+    # random.choices does not have to accumulate them itself
+    cum_weights = list(itertools.accumulate(word_weights))
+    generated_words = random.choices(all_words, cum_weights=cum_weights, k=word_count)
+    
+    # Format into sentences, yielding one line at a time
     words_per_line = 10
     
     for i in range(0, len(generated_words), words_per_line):
         line_words = generated_words[i:i+words_per_line]
-        line = ' '.join(line_words)
-        # Capitalize first word and add period
-        line = line.capitalize() + '.'
-        text_lines.append(line)
+        # Capitalize first word and add period before joining, so each
+        # line is assembled with a single join
+        line_words[0] = line_words[0].capitalize()
+        line_words[-1] += '.\n'
+        yield ' '.join(line_words)
+
+def create_sample_file(data_dir, config):
+    """
+    Generate a single sample text file
+    
+    Args:
+        data_dir: Directory where the file is written
+        config: File configuration (name, word_count, unique_words, description)
     
-    return '\n'.join(text_lines)
+    Returns:
+        Path of the created file
+    """
+    
+    # Add header comment
+    header = f"# {config['description']}\n# Generated for Hadoop MapReduce WordCount assignment\n# Word count: ~{config['word_count']}, Unique words: ~{config['unique_words']}\n\n"
+    
+    # Stream the generated text to the file line by line
+    file_path = os.path.join(data_dir, config['name'])
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write(header)
+        f.writelines(generate_sample_text_iter(config['word_count'], config['unique_words']))
+    
+    return file_path
 
 def create_sample_files():
     """
@@ -113,21 +138,15 @@ def create_sample_files():
         }
     ]
     
-    # Generate files
+    # Generate files in parallel, one worker per file
     for config in files_config:
         print(f"Generating {config['name']}...")
-        
-        # Generate text
-        text = generate_sample_text(config['word_count'], config['unique_words'])
-        
-        # Add header comment
-        header = f"# {config['description']}\n# Generated for Hadoop MapReduce WordCount assignment\n# Word count: ~{config['word_count']}, Unique words: ~{config['unique_words']}\n\n"
-        
-        # Write to file
-        file_path = os.path.join(data_dir, config['name'])
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(header + text)
-        
+    print()
+    
+    with mp.Pool(min(len(files_config), mp.cpu_count())) as pool:
+        file_paths = pool.map(partial(create_sample_file, data_dir), files_config)
+    
+    for file_path in file_paths:
         print(f"  Created: {file_path}")
         print(f"  Size: {os.path.getsize(file_path)} bytes")
         print()